@@ -5,7 +5,12 @@
 # pyright: reportUnknownArgumentType=false
 
 # standard
+import asyncio
+import os
+import re
+import threading
 from typing import (
+    TYPE_CHECKING,
     Any,
     Literal,
     cast,
@@ -13,8 +18,7 @@ from typing import (
 from uuid import UUID
 
 # third-party
-import pandas as pd
-import sqlglot
+from e2b_code_interpreter import Context as SandboxCodeContext
 from e2b_code_interpreter.code_interpreter_sync import Sandbox, Execution, ExecutionError
 from groq import BadRequestError
 from langchain_core.language_models import (
@@ -29,19 +33,9 @@ from langchain_core.messages import (
 )
 from langchain_core.runnables import Runnable
 from langchain_core.exceptions import OutputParserException
+from langgraph.constants import TAG_NOSTREAM
 from langgraph.runtime import Runtime
-from pandas.api.types import (
-    is_datetime64_any_dtype,
-    is_numeric_dtype,
-    is_object_dtype,
-)
-from pandas.errors import EmptyDataError
 from pydantic import BaseModel
-from sqlglot import (
-    exp,
-    Expression,
-    ParseError,
-)
 
 from language_model.schema.structured_output import (
     AnalyticalPlan,
@@ -60,67 +54,108 @@ from context.datasets import dataset_file_path, unlink_dataset_file
 from memory import MemoryManager
 from memory.models import (
     ChatHistoryCreate,
-    ChatHistoryShow,
+    ChatHistoryShowBatch,
     ShortMemoryCreate,
 )
 
-_SQL_VALIDATION_DIALECT: str = "postgres"
-
-_NON_READ_SQL_EXPRESSIONS: tuple[type[Expression], ...] = (
-    exp.Delete,
-    exp.Update,
-    exp.Insert,
-    exp.Create,
-    exp.Alter,
-    exp.Drop,
-    exp.TruncateTable,
-    exp.Merge,
-    exp.Copy,
-    exp.Command,
-    exp.Analyze,
-    exp.Grant,
-    exp.Revoke,
-    exp.Set,
-    exp.Transaction,
-    exp.Commit,
-    exp.Rollback,
+if TYPE_CHECKING:
+    from .sql_validation import SchemaView
+
+_DATAFRAME_SAMPLE_ROWS: int = 1000
+_DATAFRAME_SAMPLE_VALUES: int = 10
+_DATE_SNIFF_SAMPLE_SIZE: int = 20
+_DATE_SNIFF_MATCH_RATIO: float = 0.8
+_DATE_COERCE_MIN_RATIO: float = 0.9
+_DATE_LIKE_PATTERN: re.Pattern[str] = re.compile(r"^\d{4}-\d{2}-\d{2}|^\d{1,2}/\d{1,2}/\d{2,4}")
+_SANDBOX_TIMEOUT_SECONDS: int = 600
+
+_CONVERSATION_SUMMARY_HEADER: str = "\n\nConversation history summary:\n"
+_PUNT_RESPONSE_FEEDBACK: str = "\n\nFeedback why the user's request cannot be handled with the external database: {}"
+_DATABASE_SCHEMA_HEADER: str = "\n\nExternal database schema with tables and their respective column specifications:"
+_DATA_UNAVAILABILITY_RESPONSE_FEEDBACK: str = (
+    "\n\nFeedback why the required data is unavailable in the external database: {}"
 )
-
-
-def _unwrap_query_root(expression: Expression) -> Expression:
-    current: Expression = expression
-
-    while isinstance(current, (exp.Subquery, exp.Paren)):
-        current = current.this
-
-    return current
-
-
-def _read_only_root_violation(tree: Expression) -> str | None:
-    root: Expression = _unwrap_query_root(tree)
-
-    if isinstance(root, (exp.Select, exp.Union)):
-        return None
-
-    return f"only read-only SELECT queries are allowed (got {type(root).__name__})"
-
-
-def _non_read_ast_violation(tree: Expression) -> str | None:
-    if forbidden := tree.find(*_NON_READ_SQL_EXPRESSIONS):
-        return f"forbidden non read-only SQL ({type(forbidden).__name__})"
-
-    return None
-
-
-def _select_into_violation(tree: Expression) -> str | None:
-    for select in tree.find_all(exp.Select):
-        if select.args.get("into"):
-            return "SELECT ... INTO is not allowed (creates a database object)"
-
-    return None
+_DATA_RETRIEVAL_PLAN: str = "\n\nData retrieval plan that was generated to answer current request: {}"
+_DATAFRAME_SCHEMA_HEADER: str = "\n\nDataframe schema with columns and sample value(s): "
+_DATAFRAME_SCHEMA_UNAVAILABLE: str = "\n\nNo dataframe schema information available."
+_DATA_RETRIEVAL_PLAN_EXECUTION_FEEDBACK: str = "\n\nFeedback on the data retrieval execution from external database: {}"
+_DATA_RETRIEVAL_PLAN_OBSERVATION_FEEDBACK: str = "\n\nFeedback why the data retrieval result is insufficient: {}"
+_DATA_RETRIEVAL_FAILURE_SUMMARY: str = "\n\nFailure log:\n{}"
+_ANALYTICAL_PLAN_HEADER: str = "\n\nAnalytical plan that was generated previously: "
+_ANALYTICAL_PLAN_EXECUTION_FEEDBACK: str = "\n\nTraceback error logs from the sandbox environment: {}"
+_ANALYTICAL_PLAN_OBSERVATION_FEEDBACK: str = "\n\nFeedback why the analytical plan execution result is insufficient: {}"
+_ANALYTICAL_PLAN_EXECUTION_RESULT: str = "\n\nExecution output logs of the analytical plan: {}"
+_ANALYTICAL_PLAN_OBSERVATION_RESULT: str = "\n\nObservation on the analytical plan execution result: {}"
+
+
+def _build_structured_runnable(
+    model: BaseChatModel,
+    schema: type[BaseModel],
+    structured_output_method: Literal["json_schema", "json_mode", "function_calling"],
+) -> Runnable[LanguageModelInput, dict[Any, Any] | BaseModel]:
+    # The model is copied with:
+    # - cache=False, because the global LLM cache would replay an unparsable response on every retry attempt.
+    # - disable_streaming=True plus the nostream tag, because structured outputs are only usable once complete
+    #   and must stay out of LangGraph's "messages" token stream.
+    structured_model: BaseChatModel = model.model_copy(update={"cache": False, "disable_streaming": True})
+
+    llm = cast(
+        typ=Runnable[LanguageModelInput, dict[Any, Any] | BaseModel],
+        val=structured_model.with_structured_output(
+            schema=schema,
+            method=structured_output_method,
+        ),
+    )
+
+    return llm.with_retry(
+        retry_if_exception_type=(
+            BadRequestError,
+            OutputParserException,
+        ),
+        stop_after_attempt=3,
+    ).with_config(tags=[TAG_NOSTREAM])
+
+
+def _render_database_schema(schema: dict[str, list[dict[str, Any]]]) -> str:
+    # Values are rendered with str() rather than repr() so that e.g. Decimal('1.5'), datetime(...) or
+    # single-element result rows do not leak constructor noise into the prompt.
+    parts: list[str] = [_DATABASE_SCHEMA_HEADER]
+
+    for table_name, column_item in schema.items():
+        parts.append(f"\n- Table '{table_name}' has following column specifications:")
+
+        for column in column_item:
+            parts.append(f"\n\t- Column '{column['name']}' of type '{column['type']}'. ")
+
+            if column.get("comment", None):
+                parts.append(f"It describes about '{column['comment']}'. ")
+            if column.get("sample_values", None):
+                parts.append(f"It has sample value(s) such as `{[str(value) for value in column['sample_values']]}`. ")
+            if column.get("earliest_timestamp", None):
+                parts.append(f"It has the earliest timestamp value as `{column['earliest_timestamp'][0]}`. ")
+            if column.get("latest_timestamp", None):
+                parts.append(f"It has the latest timestamp value as `{column['latest_timestamp'][0]}`. ")
+
+    return "".join(parts)
 
 
 class Composer:
+    __slots__ = (
+        "context_manager",
+        "memory_manager",
+        "default_model",
+        "_database_schema_info",
+        "_database_schema_prefetch",
+        "_dataframe_schema_info",
+        "_sql_schema_view",
+        "_sandboxes",
+        "_structured_runnables",
+        "_conversation_summary_list",
+        "_relevant_chat_history",
+        "_memory_generation",
+        "_memory_cache_lock",
+    )
+
     def __init__(
         self, context_manager: ContextManager, memory_manager: MemoryManager, default_model: BaseChatModel
     ) -> None:
@@ -130,17 +165,49 @@ class Composer:
         self.context_manager: ContextManager = context_manager
         self.memory_manager: MemoryManager = memory_manager
         self.default_model: BaseChatModel = default_model
+        self._database_schema_info: tuple[int, str] | None = None
+        self._database_schema_prefetch: threading.Thread | None = None
+        self._dataframe_schema_info: tuple[tuple[int, int], str] | None = None
+        self._sql_schema_view: tuple[int, SchemaView] | None = None
+        self._sandboxes: dict[str, Sandbox] = {}
+        self._structured_runnables: dict[
+            tuple[int, type[BaseModel], str], Runnable[LanguageModelInput, dict[Any, Any] | BaseModel]
+        ] = {}
+        self._conversation_summary_list: str | None = None
+        self._relevant_chat_history: tuple[tuple[int, ...], list[AnyMessage]] | None = None
+        # Bumped by save_current_interaction; a memory read only fills the caches above if no save
+        # happened while it ran, so a concurrent thread can never write a pre-save value back.
+        self._memory_generation: int = 0
+        self._memory_cache_lock: threading.Lock = threading.Lock()
 
     def get_conversation_summary_list(self) -> str:
         """
         Retrieve a summary list of past conversations from short-term memory.
+
+        The list is kept until save_current_interaction stores a new turn.
         """
-        context_prompt: str = "\n\nConversation history summary:\n"
+        with self._memory_cache_lock:
+            if self._conversation_summary_list is not None:
+                return self._conversation_summary_list
 
-        for short_memory in self.memory_manager.index_short_memory():
-            context_prompt += f"\n[TURN-{short_memory.turn_num}]: {short_memory.summary}"
+            memory_generation: int = self._memory_generation
 
-        return context_prompt
+        turn_lines: list[str] = [
+            f"\n[TURN-{turn_num}]: {summary}" for turn_num, summary in self.memory_manager.iter_short_memory_summaries()
+        ]
+        conversation_summary_list: str = _CONVERSATION_SUMMARY_HEADER + "".join(turn_lines)
+
+        with self._memory_cache_lock:
+            if self._memory_generation == memory_generation:
+                self._conversation_summary_list = conversation_summary_list
+
+        return conversation_summary_list
+
+    async def aget_conversation_summary_list(self) -> str:
+        """
+        Asynchronously retrieve the conversation summary list without blocking the event loop.
+        """
+        return await asyncio.to_thread(self.get_conversation_summary_list)
 
     def _uses_conversation_messages(self, state: State) -> bool:
         """
@@ -175,162 +242,198 @@ class Composer:
         resolved_model: BaseChatModel = model or self.default_model
 
         if schema:
-            llm = cast(
-                typ=Runnable[LanguageModelInput, dict[Any, Any] | BaseModel],
-                val=resolved_model.with_structured_output(
-                    schema=schema,
-                    method=structured_output_method,
-                ),
-            )
+            # Building the structured output runnable converts the schema on every call, so keep one per combination.
+            runnable_key: tuple[int, type[BaseModel], str] = (id(resolved_model), schema, structured_output_method)
+            llm = self._structured_runnables.get(runnable_key)
 
-            llm = llm.with_retry(
-                retry_if_exception_type=(
-                    BadRequestError,
-                    OutputParserException,
-                ),
-                stop_after_attempt=3,
-            )
+            if llm is None:
+                llm = _build_structured_runnable(resolved_model, schema, structured_output_method)
+                self._structured_runnables[runnable_key] = llm
         else:
             llm = resolved_model
 
         llm_input: list[AnyMessage] = [system_message]
 
         if state["context_distillation"] and not self._uses_conversation_messages(state):
-            llm_input.extend([HumanMessage(state["context_distillation"].content)])
+            llm_input.append(HumanMessage(state["context_distillation"].content))
         else:
             if state["intent_comprehension"]:
-                for turn_num in state["intent_comprehension"].relevant_turns:
-                    params: ChatHistoryShow = ChatHistoryShow(turn_num=int(turn_num))
-
-                    for chat in self.memory_manager.show_chat_history(params):
-                        llm_input.extend(
-                            [HumanMessage(content=chat.content)]
-                            if chat.role == "human"
-                            else [AIMessage(content=chat.content)]
-                        )
+                llm_input.extend(
+                    self._get_relevant_chat_history(
+                        tuple(int(turn_num) for turn_num in state["intent_comprehension"].relevant_turns)
+                    )
+                )
 
             llm_input.extend(state["messages"])
 
         return (llm, llm_input)
 
+    def _get_relevant_chat_history(self, turn_nums: tuple[int, ...]) -> list[AnyMessage]:
+        """
+        Retrieve the chat messages of the relevant past turns, reusing the last lookup for the same turns.
+        """
+        with self._memory_cache_lock:
+            if self._relevant_chat_history and self._relevant_chat_history[0] == turn_nums:
+                return self._relevant_chat_history[1]
+
+            memory_generation: int = self._memory_generation
+
+        params: ChatHistoryShowBatch = ChatHistoryShowBatch(turn_nums=list(turn_nums))
+        chat_messages: list[AnyMessage] = [
+            HumanMessage(content=chat.content) if chat.role == "human" else AIMessage(content=chat.content)
+            for chat in self.memory_manager.show_chat_history_batch(params)
+        ]
+
+        with self._memory_cache_lock:
+            if self._memory_generation == memory_generation:
+                self._relevant_chat_history = (turn_nums, chat_messages)
+
+        return chat_messages
+
     def get_punt_response_feedback(self, state: State) -> str:
         """
         Retrieve feedback for punt response based on request classification.
         """
-        context_prompt: str = "\n\nFeedback why the user's request cannot be handled with the external database: "
-        context_prompt += cast(RequestClassification, state["request_classification"]).rationale
+        return _PUNT_RESPONSE_FEEDBACK.format(cast(RequestClassification, state["request_classification"]).rationale)
 
-        return context_prompt
+    def prefetch_database_schema_info(self) -> None:
+        """
+        Warm the database schema info in a background thread once a turn is known to need data.
+        """
+        schema_version: int = self.context_manager.schema_version
+
+        if self._database_schema_info and self._database_schema_info[0] == schema_version:
+            return
+        if self._database_schema_prefetch and self._database_schema_prefetch.is_alive():
+            return
+
+        self._database_schema_prefetch = threading.Thread(target=self.get_database_schema_info, daemon=True)
+        self._database_schema_prefetch.start()
 
     def get_database_schema_info(self) -> str:
         """
         Retrieve the external database schema information.
         """
-        context_prompt: str = "\n\nExternal database schema with tables and their respective column specifications:"
-        schema: dict[str, list[dict[str, Any]]] = self.context_manager.inspect_external_database()
+        prefetch: threading.Thread | None = self._database_schema_prefetch
 
-        for table_name, column_item in schema.items():
-            context_prompt += f"\n- Table '{table_name}' has following column specifications:"
+        # Wait for a running prefetch instead of introspecting the database a second time.
+        if prefetch and prefetch is not threading.current_thread() and prefetch.is_alive():
+            prefetch.join()
 
-            for column in column_item:
-                context_prompt += f"\n\t- Column '{column['name']}' of type '{column['type']}'. "
-                context_prompt += f"It describes about '{column['comment']}'. " if column.get("comment", None) else ""
-                context_prompt += (
-                    f"It has sample value(s) such as `{column['sample_values']}`. "
-                    if column.get("sample_values", None)
-                    else ""
-                )
-                context_prompt += (
-                    f"It has the earliest timestamp value as `{column['earliest_timestamp']}`. "
-                    if column.get("earliest_timestamp", None)
-                    else ""
-                )
-                context_prompt += (
-                    f"It has the latest timestamp value as `{column['latest_timestamp']}`. "
-                    if column.get("latest_timestamp", None)
-                    else ""
-                )
+        schema_version: int = self.context_manager.schema_version
+
+        if self._database_schema_info and self._database_schema_info[0] == schema_version:
+            return self._database_schema_info[1]
+
+        context_prompt: str = _render_database_schema(self.context_manager.inspect_external_database())
+
+        self._database_schema_info = (schema_version, context_prompt)
 
         return context_prompt
 
+    async def aget_database_schema_info(self) -> str:
+        """
+        Asynchronously retrieve the external database schema information without blocking the event loop.
+        """
+        return await asyncio.to_thread(self.get_database_schema_info)
+
     def get_data_unavailability_response_feedback(self, state: State) -> str:
         """
         Retrieve feedback for data unavailability response based on data availability.
         """
-        context_prompt: str = "\n\nFeedback why the required data is unavailable in the external database: "
-        context_prompt += cast(DataAvailability, state["data_availability"]).rationale
-
-        return context_prompt
+        return _DATA_UNAVAILABILITY_RESPONSE_FEEDBACK.format(
+            cast(DataAvailability, state["data_availability"]).rationale
+        )
 
     def get_data_retrieval_plan(self, state: State) -> str:
         """
         Retrieve the data retrieval plan including SQL query and rationale.
         """
-        context_prompt: str = "\n\nData retrieval plan that was generated to answer current request: "
-        context_prompt += str(cast(DataRetrievalPlan, state["data_retrieval_plan"]))
-
-        return context_prompt
+        return _DATA_RETRIEVAL_PLAN.format(cast(DataRetrievalPlan, state["data_retrieval_plan"]))
 
     def get_dataframe_schema_info(self) -> str:
         """
-        Retrieve the dataframe schema from the dataset CSV file.
+        Retrieve the dataframe schema from a sample of the dataset CSV file.
         """
+        # pandas is heavy to import and is not needed until a dataset has been retrieved.
+        import pandas as pd
+        from pandas.api.types import (
+            is_datetime64_any_dtype,
+            is_numeric_dtype,
+            is_object_dtype,
+        )
+        from pandas.errors import EmptyDataError
+
         if not dataset_file_path.exists():
             dataset_file_path.touch()
 
+        dataset_stat: os.stat_result = dataset_file_path.stat()
+        dataset_key: tuple[int, int] = (dataset_stat.st_mtime_ns, dataset_stat.st_size)
+
+        if self._dataframe_schema_info and self._dataframe_schema_info[0] == dataset_key:
+            return self._dataframe_schema_info[1]
+
         try:
-            context_prompt: str = "\n\nDataframe schema with columns and sample value(s): "
-            col_value_dict: dict[str, tuple[str, Any]] = {}
-            dset_attrs: str = ""
-            df: pd.DataFrame = pd.read_csv(dataset_file_path)
+            col_value_dict: dict[str, tuple[str, list[str]]] = {}
+            df: pd.DataFrame = pd.read_csv(dataset_file_path, nrows=_DATAFRAME_SAMPLE_ROWS)
 
             for column in df.columns:
                 if is_object_dtype(df[column]):
-                    try:
-                        df[column] = pd.to_datetime(df[column])
-                    except Exception as _:
-                        continue
+                    sample: pd.Series = df[column].dropna().head(_DATE_SNIFF_SAMPLE_SIZE).astype(str)
+
+                    if not sample.empty and sample.str.match(_DATE_LIKE_PATTERN).mean() > _DATE_SNIFF_MATCH_RATIO:
+                        converted: pd.Series = pd.to_datetime(df[column], errors="coerce", format="mixed", cache=True)
+
+                        if converted.notna().sum() >= _DATE_COERCE_MIN_RATIO * df[column].notna().sum():
+                            df[column] = converted
 
-            for column in df.columns:
                 try:
                     # Even if data_retrieval_plan is set to ignore identifiers,
                     # we must implement a manual override to ensure they are strictly excluded.
                     UUID(df[column].iloc[0])
                 except Exception as _:
                     if is_datetime64_any_dtype(df[column]):
-                        col_value_dict[column] = (str(df[column].dtype), df[column].unique()[:1])
+                        sample_size: int = 1
                     elif is_numeric_dtype(df[column]):
-                        col_value_dict[column] = (str(df[column].dtype), df[column].unique()[:2])
+                        sample_size = 2
                     else:
-                        col_value_dict[column] = (str(df[column].dtype), df[column].unique())
-
-            for col_name, values in col_value_dict.items():
-                dset_attrs += f"\n- {col_name} ({values[0]}): {list(str(value) for value in values[1])}"
+                        sample_size = _DATAFRAME_SAMPLE_VALUES
 
-            context_prompt += dset_attrs
+                    col_value_dict[column] = (
+                        str(df[column].dtype),
+                        df[column].drop_duplicates().head(sample_size).astype(str).tolist(),
+                    )
 
-            return context_prompt
+            context_prompt: str = _DATAFRAME_SCHEMA_HEADER + "".join(
+                f"\n- {col_name} ({values[0]}): {values[1]}" for col_name, values in col_value_dict.items()
+            )
 
         except EmptyDataError as _:
-            return "\n\nNo dataframe schema information available."
+            context_prompt = _DATAFRAME_SCHEMA_UNAVAILABLE
+
+        self._dataframe_schema_info = (dataset_key, context_prompt)
+
+        return context_prompt
+
+    async def aget_dataframe_schema_info(self) -> str:
+        """
+        Asynchronously retrieve the dataframe schema without blocking the event loop.
+        """
+        return await asyncio.to_thread(self.get_dataframe_schema_info)
 
     def get_data_retrieval_plan_execution_feedback(self, state: State) -> str:
         """
         Retrieve feedback for data retrieval plan execution errors.
         """
-        context_prompt: str = "\n\nFeedback on the data retrieval execution from external database: "
-        context_prompt += str(state["data_retrieval_plan_execution"])
-
-        return context_prompt
+        return _DATA_RETRIEVAL_PLAN_EXECUTION_FEEDBACK.format(state["data_retrieval_plan_execution"])
 
     def get_data_retrieval_plan_observation_feedback(self, state: State) -> str:
         """
         Retrieve feedback for data retrieval plan observation.
         """
-        context_prompt: str = "\n\nFeedback why the data retrieval result is insufficient: "
-        context_prompt += cast(DataRetrievalPlanObservation, state["data_retrieval_plan_observation"]).rationale
-
-        return context_prompt
+        return _DATA_RETRIEVAL_PLAN_OBSERVATION_FEEDBACK.format(
+            cast(DataRetrievalPlanObservation, state["data_retrieval_plan_observation"]).rationale
+        )
 
     def get_data_retrieval_failure_summary(self, state: State) -> str:
         """
@@ -339,117 +442,103 @@ class Composer:
         failure_history: list[str] = state["data_retrieval_failure_history"]
         failure_log: str = "\n".join(f"- Attempt {i + 1}: {f}" for i, f in enumerate(failure_history))
 
-        return f"\n\nFailure log:\n{failure_log}"
+        return _DATA_RETRIEVAL_FAILURE_SUMMARY.format(failure_log)
 
     def get_analytical_python_code(self, state: State, runtime: Runtime[Context]) -> str:
         """
         Retrieve the analytical Python code including bootstrap.
         """
         analysis_plan: AnalyticalPlan = cast(AnalyticalPlan, state["analytical_plan"])
-        code: str = runtime.context.analytical_sandbox_bootstrap[analysis_plan.analysis_type]
+        code_parts: list[str] = [runtime.context.analytical_sandbox_bootstrap[analysis_plan.analysis_type]]
 
         for analytical_step in analysis_plan.plan:
             step_code: str = analytical_step.python_code.replace("\\n", "\n").replace("\\t", "\t")
-            code += "\n" + step_code + "\n"
+            code_parts.append("\n" + step_code + "\n")
 
             step_marker: str = f"STEP {analytical_step.number} RESULT"
             if step_marker not in step_code:
-                code += f'\nprint("{step_marker}")\n'
-                code += f"print({analytical_step.output_df})\n"
+                code_parts.append(f'\nprint("{step_marker}")\n')
+                code_parts.append(f"print({analytical_step.output_df})\n")
 
-        return code
+        return "".join(code_parts)
 
     def get_analytical_plan(self, state: State, original: bool = False) -> str:
         """
         Retrieve the analytical plan with step-by-step rationale.
         """
-        context_prompt: str = "\n\nAnalytical plan that was generated previously: "
+        step_lines: list[str] = [
+            f"\n{analytical_step.number}. {analytical_step.rationale}" if not original else f"\n- {analytical_step}"
+            for analytical_step in cast(AnalyticalPlan, state["analytical_plan"]).plan
+        ]
 
-        for analytical_step in cast(AnalyticalPlan, state["analytical_plan"]).plan:
-            context_prompt += (
-                f"\n{analytical_step.number}. {analytical_step.rationale}" if not original else f"\n- {analytical_step}"
-            )
-
-        return context_prompt
+        return _ANALYTICAL_PLAN_HEADER + "".join(step_lines)
 
     def get_analytical_plan_execution_feedback(self, state: State) -> str:
         """
         Retrieve feedback for analytical plan execution errors.
         """
-        context_prompt: str = "\n\nTraceback error logs from the sandbox environment: "
-        context_prompt += cast(ExecutionError, cast(Execution, state["analytical_plan_execution"]).error).traceback
-
-        return context_prompt
+        return _ANALYTICAL_PLAN_EXECUTION_FEEDBACK.format(
+            cast(ExecutionError, cast(Execution, state["analytical_plan_execution"]).error).traceback
+        )
 
     def get_analytical_plan_observation_feedback(self, state: State) -> str:
         """
         Retrieve feedback for analytical plan observation.
         """
-        context_prompt: str = "\n\nFeedback why the analytical plan execution result is insufficient: "
-        context_prompt += cast(AnalyticalPlanObservation, state["analytical_plan_observation"]).rationale
-
-        return context_prompt
+        return _ANALYTICAL_PLAN_OBSERVATION_FEEDBACK.format(
+            cast(AnalyticalPlanObservation, state["analytical_plan_observation"]).rationale
+        )
 
     def get_analytical_plan_execution_result(self, state: State) -> str:
         """
         Retrieve the analytical plan execution result logs.
         """
-        context_prompt: str = "\n\nExecution output logs of the analytical plan: "
         stdout: list[str] = cast(Execution, state["analytical_plan_execution"]).logs.stdout
-        context_prompt += stdout[0] if stdout else "(no output captured)"
 
-        return context_prompt
+        return _ANALYTICAL_PLAN_EXECUTION_RESULT.format(stdout[0] if stdout else "(no output captured)")
 
     def get_analytical_plan_observation_result(self, state: State) -> str:
         """
         Retrieve the analytical plan observation rationale.
         """
-        context_prompt: str = "\n\nObservation on the analytical plan execution result: "
-        context_prompt += cast(AnalyticalPlanObservation, state["analytical_plan_observation"]).rationale
-
-        return context_prompt
-
-    # Should the following method be part of Composer class?
+        return _ANALYTICAL_PLAN_OBSERVATION_RESULT.format(
+            cast(AnalyticalPlanObservation, state["analytical_plan_observation"]).rationale
+        )
 
-    def validate_sql_query(self, state: State) -> ValueError | None:
+    def _get_sql_schema_view(self) -> "SchemaView":
         """
-        Validate the SQL query against the provided database schema.
+        Retrieve the names a query may reference in the external database, cached per schema version.
         """
-        try:
-            sql_query: str = cast(DataRetrievalPlan, state["data_retrieval_plan"]).sql_query.strip()
+        from .sql_validation import SchemaView
 
-            if not sql_query:
-                return ValueError("SQL query is empty")
+        schema_version: int = self.context_manager.schema_version
 
-            parsed: list[Expression | None] = sqlglot.parse(sql_query, dialect=_SQL_VALIDATION_DIALECT)
-            statements: list[Expression] = [s for s in parsed if s is not None]
+        if self._sql_schema_view and self._sql_schema_view[0] == schema_version:
+            return self._sql_schema_view[1]
 
-            if len(statements) != 1:
-                return ValueError("Exactly one SQL statement is required (multiple statements are not allowed)")
+        schema_view: SchemaView = SchemaView.from_raw(self.context_manager.inspect_external_database())
+        self._sql_schema_view = (schema_version, schema_view)
 
-            tree: Expression = statements[0]
+        return schema_view
 
-            if msg := _read_only_root_violation(tree):
-                return ValueError(msg)
-            if msg := _non_read_ast_violation(tree):
-                return ValueError(msg)
-            if msg := _select_into_violation(tree):
-                return ValueError(msg)
+    # Should the following method be part of Composer class?
 
-            tables: list[str] = [table.name for table in tree.find_all(exp.Table)]
-            columns: list[str] = [column.name for column in tree.find_all(exp.Column)]
-            schema: dict[str, list[dict[str, Any]]] = self.context_manager.inspect_external_database()
+    def validate_sql_query(self, state: State) -> ValueError | None:
+        """
+        Validate the SQL query against the provided database schema.
+        """
+        sql_query: str = cast(DataRetrievalPlan, state["data_retrieval_plan"]).sql_query.strip()
 
-            for table in tables:
-                if table not in schema.keys():
-                    return ValueError(f"Unknown table: {table}")
+        if not sql_query:
+            return ValueError("SQL query is empty")
 
-            for column in columns:
-                if column not in [col["name"] for col_list in schema.values() for col in col_list]:
-                    return ValueError(f"Unknown column: {column}")
+        # sqlglot is only needed from here on, so its import cost is paid on the first validation.
+        from .sql_validation import find_sql_query_violation
 
-        except ParseError as e:
-            return ValueError(f"Invalid SQL Syntax: {e}")
+        if msg := find_sql_query_violation(sql_query, self._get_sql_schema_view()):
+            return ValueError(msg)
+
+        return None
 
     def extract_external_database(self, state: State) -> ValueError | None:
         """
@@ -459,16 +548,36 @@ class Composer:
             cast(DataRetrievalPlan, state["data_retrieval_plan"]).sql_query
         )
 
-    def prepare_sandbox_environment(self) -> Sandbox:
+    def prepare_sandbox_environment(self, thread_id: str) -> tuple[Sandbox, SandboxCodeContext]:
         """
-        Prepare the sandbox environment with the dataset CSV file.
+        Prepare the sandbox environment of a thread with the dataset CSV file.
+
+        The sandbox is kept per thread, so the analytical plan retries of a run reuse it without
+        touching other conversations. The API releases it through release_sandbox_environment
+        when the run stops streaming for any reason. Every call returns a fresh code context, so
+        a retry never sees the kernel state of a failed attempt.
         """
-        sandbox: Sandbox = Sandbox.create()
+        sandbox: Sandbox | None = self._sandboxes.get(thread_id)
+
+        if sandbox and sandbox.is_running():
+            sandbox.set_timeout(_SANDBOX_TIMEOUT_SECONDS)
+        else:
+            sandbox = Sandbox.create(timeout=_SANDBOX_TIMEOUT_SECONDS)
+            self._sandboxes[thread_id] = sandbox
 
         with open(dataset_file_path, "rb") as dataset:
             sandbox.files.write("dataset.csv", dataset.read())
 
-        return sandbox
+        return sandbox, sandbox.create_code_context()
+
+    def release_sandbox_environment(self, thread_id: str) -> None:
+        """
+        Kill the sandbox kept by prepare_sandbox_environment for the thread, if any.
+        """
+        sandbox: Sandbox | None = self._sandboxes.pop(thread_id, None)
+
+        if sandbox:
+            sandbox.kill()
 
     def save_current_interaction(self, state: State, llm_output: AIMessage, turn_num: int) -> None:
         """
@@ -490,4 +599,9 @@ class Composer:
 
         self.memory_manager.store_short_memory(create_short_memory_params())
 
+        with self._memory_cache_lock:
+            self._memory_generation += 1
+            self._conversation_summary_list = None
+            self._relevant_chat_history = None
+
         unlink_dataset_file()
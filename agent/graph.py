@@ -3,7 +3,7 @@
 # pyright: reportUnknownMemberType=false
 
 # standard
-import sys
+import asyncio
 from typing import (
     Any,
     Literal,
@@ -11,7 +11,7 @@ from typing import (
 )
 
 # third-party
-from e2b_code_interpreter import Execution
+from e2b_code_interpreter import Context as SandboxCodeContext, Execution
 from e2b_code_interpreter.code_interpreter_sync import (
     Sandbox,
 )
@@ -20,6 +20,7 @@ from langchain_core.messages import (
     HumanMessage,
     SystemMessage,
 )
+from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import (
     StateGraph,
@@ -38,7 +39,12 @@ from .state import State
 from .runtime import Context
 from context import ContextManager
 from context.database import external_db_url
-from language_model.provider import groq_gpt_120b_high, groq_qwen
+from language_model.provider import (
+    LOW_EFFORT_FEEDBACK_ENABLED,
+    groq_gpt_120b_low,
+    groq_gpt_120b_high,
+    groq_qwen,
+)
 from language_model.schema import (
     IntentComprehension,
     RequestClassification,
@@ -71,12 +77,14 @@ class Graph:
             context_schema=Context,
         )
 
-    def __intent_comprehension(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
+        self.compiled_graph: CompiledStateGraph[State, Context] | None = None
+
+    async def __intent_comprehension(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
         """
         Node to handle intent comprehension.
         """
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
-        context_prompt: str = self.composer.get_conversation_summary_list()
+        system_prompt: str = runtime.context.prompts_set["__intent_comprehension"]
+        context_prompt: str = await self.composer.aget_conversation_summary_list()
         system_message: SystemMessage = SystemMessage(system_prompt + context_prompt)
 
         llm, llm_input = self.composer.get_runnable_with_input(
@@ -85,7 +93,7 @@ class Graph:
             schema=IntentComprehension,
         )
 
-        llm_output = llm.invoke(llm_input)
+        llm_output = await llm.ainvoke(llm_input)
         serialized_output: IntentComprehension = IntentComprehension.model_validate(llm_output)
 
         return {
@@ -94,7 +102,7 @@ class Graph:
             "intent_comprehension": serialized_output,
         }
 
-    def __request_classification(
+    async def __request_classification(
         self, state: State, runtime: Runtime[Context]
     ) -> Command[
         Literal[
@@ -105,8 +113,8 @@ class Graph:
         """
         Node to handle request classification.
         """
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
-        context_prompt: str = self.composer.get_conversation_summary_list()
+        system_prompt: str = runtime.context.prompts_set["__request_classification"]
+        context_prompt: str = await self.composer.aget_conversation_summary_list()
         system_message: SystemMessage = SystemMessage(system_prompt + context_prompt)
 
         llm, llm_input = self.composer.get_runnable_with_input(
@@ -115,7 +123,7 @@ class Graph:
             schema=RequestClassification,
         )
 
-        llm_output = llm.invoke(llm_input)
+        llm_output = await llm.ainvoke(llm_input)
         serialized_output: RequestClassification = RequestClassification.model_validate(llm_output)
 
         if serialized_output.request_is_business_analytical_domain:
@@ -137,20 +145,21 @@ class Graph:
             },
         )
 
-    def __punt_response(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
+    async def __punt_response(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
         """
         Node to handle punt response.
         """
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
+        system_prompt: str = runtime.context.prompts_set["__punt_response"]
         context_prompt: str = self.composer.get_punt_response_feedback(state)
         system_message: SystemMessage = SystemMessage(system_prompt + context_prompt)
 
         llm, llm_input = self.composer.get_runnable_with_input(
             system_message=system_message,
             state=state,
+            model=groq_gpt_120b_low if LOW_EFFORT_FEEDBACK_ENABLED else None,
         )
 
-        llm_output: AIMessage = cast(AIMessage, llm.invoke(llm_input))
+        llm_output: AIMessage = cast(AIMessage, await llm.ainvoke(llm_input))
 
         return {
             "ui_payload": "Ready to go!",
@@ -158,11 +167,11 @@ class Graph:
             "messages": [llm_output],
         }
 
-    def __context_distillation(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
+    async def __context_distillation(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
         """
         Node to handle context distillation.
         """
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
+        system_prompt: str = runtime.context.prompts_set["__context_distillation"]
         system_message: SystemMessage = SystemMessage(system_prompt)
 
         llm, llm_input = self.composer.get_runnable_with_input(
@@ -170,7 +179,7 @@ class Graph:
             state=state,
         )
 
-        llm_output: AIMessage = cast(AIMessage, llm.invoke(llm_input))
+        llm_output: AIMessage = cast(AIMessage, await llm.ainvoke(llm_input))
 
         return {
             "ui_payload": "Surveying database landscape...",
@@ -178,7 +187,7 @@ class Graph:
             "context_distillation": llm_output,
         }
 
-    def __analytical_requirement(
+    async def __analytical_requirement(
         self,
         state: State,
         runtime: Runtime[Context],
@@ -186,8 +195,8 @@ class Graph:
         """
         Node to handle analytical requirement.
         """
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
-        context_prompt: str = self.composer.get_conversation_summary_list()
+        system_prompt: str = runtime.context.prompts_set["__analytical_requirement"]
+        context_prompt: str = await self.composer.aget_conversation_summary_list()
         system_message: SystemMessage = SystemMessage(system_prompt + context_prompt)
 
         llm, llm_input = self.composer.get_runnable_with_input(
@@ -196,10 +205,12 @@ class Graph:
             schema=AnalyticalRequirement,
         )
 
-        llm_output = llm.invoke(llm_input)
+        llm_output = await llm.ainvoke(llm_input)
         serialized_output: AnalyticalRequirement = AnalyticalRequirement.model_validate(llm_output)
 
         if serialized_output.analytical_process_is_required:
+            self.composer.prefetch_database_schema_info()
+
             return Command(
                 goto="data_availability",
                 update={
@@ -218,11 +229,11 @@ class Graph:
             },
         )
 
-    def __direct_response(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
+    async def __direct_response(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
         """
         Node to handle direct response.
         """
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
+        system_prompt: str = runtime.context.prompts_set["__direct_response"]
         system_message: SystemMessage = SystemMessage(system_prompt)
 
         llm, llm_input = self.composer.get_runnable_with_input(
@@ -230,7 +241,7 @@ class Graph:
             state=state,
         )
 
-        llm_output: AIMessage = cast(AIMessage, llm.invoke(llm_input))
+        llm_output: AIMessage = cast(AIMessage, await llm.ainvoke(llm_input))
 
         return {
             "ui_payload": "Ready to go!",
@@ -238,7 +249,7 @@ class Graph:
             "messages": [llm_output],
         }
 
-    def __data_availability(
+    async def __data_availability(
         self, state: State, runtime: Runtime[Context]
     ) -> Command[
         Literal[
@@ -259,7 +270,7 @@ class Graph:
         additional_context: str | None = None
 
         if state["data_retrieval_retry_count"] >= MAX_CORRECTION_RETRIES:
-            system_prompt = runtime.context.prompts_set[sys._getframe(0).f_code.co_name + "_from_data_retrieval_plan"]
+            system_prompt = runtime.context.prompts_set["__data_availability_from_data_retrieval_plan"]
 
             context_prompt = self.composer.get_data_retrieval_failure_summary(state)
             system_message = SystemMessage(system_prompt + context_prompt)
@@ -269,12 +280,12 @@ class Graph:
                 state=state,
             )
 
-            summary_output: AIMessage = cast(AIMessage, llm.invoke(llm_input))
+            summary_output: AIMessage = cast(AIMessage, await llm.ainvoke(llm_input))
             interrupt_message: str = summary_output.content if isinstance(summary_output.content, str) else ""
             additional_context = interrupt(interrupt_message)
 
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
-        context_prompt: str = self.composer.get_database_schema_info()
+        system_prompt: str = runtime.context.prompts_set["__data_availability"]
+        context_prompt: str = await self.composer.aget_database_schema_info()
 
         if additional_context:
             context_prompt += (
@@ -289,7 +300,7 @@ class Graph:
             schema=DataAvailability,
         )
 
-        llm_output = llm.invoke(llm_input)
+        llm_output = await llm.ainvoke(llm_input)
         serialized_output: DataAvailability = DataAvailability.model_validate(llm_output)
 
         if serialized_output.data_is_available:
@@ -315,20 +326,21 @@ class Graph:
             },
         )
 
-    def __data_unavailability_response(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
+    async def __data_unavailability_response(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
         """
         Node to handle data unavailability response.
         """
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
+        system_prompt: str = runtime.context.prompts_set["__data_unavailability_response"]
         context_prompt: str = self.composer.get_data_unavailability_response_feedback(state)
         system_message: SystemMessage = SystemMessage(system_prompt + context_prompt)
 
         llm, llm_input = self.composer.get_runnable_with_input(
             system_message=system_message,
             state=state,
+            model=groq_gpt_120b_low if LOW_EFFORT_FEEDBACK_ENABLED else None,
         )
 
-        llm_output: AIMessage = cast(AIMessage, llm.invoke(llm_input))
+        llm_output: AIMessage = cast(AIMessage, await llm.ainvoke(llm_input))
 
         return {
             "ui_payload": "Ready to go!",
@@ -336,7 +348,7 @@ class Graph:
             "messages": [llm_output],
         }
 
-    def __data_retrieval_plan(
+    async def __data_retrieval_plan(
         self, state: State, runtime: Runtime[Context]
     ) -> Command[
         Literal[
@@ -356,28 +368,24 @@ class Graph:
                 },
             )
 
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
-        context_prompt: str = self.composer.get_database_schema_info()
+        prompt_key: str = "__data_retrieval_plan"
+        context_parts: list[str] = [await self.composer.aget_database_schema_info()]
 
         if state["data_retrieval_plan"]:
-            context_prompt += self.composer.get_data_retrieval_plan(state)
+            context_parts.append(self.composer.get_data_retrieval_plan(state))
 
         if state["data_retrieval_plan_execution"]:
-            system_prompt = runtime.context.prompts_set[
-                sys._getframe(0).f_code.co_name + "_from_data_retrieval_plan_execution"
-            ]
+            prompt_key = "__data_retrieval_plan_from_data_retrieval_plan_execution"
 
-            context_prompt += self.composer.get_data_retrieval_plan_execution_feedback(state)
+            context_parts.append(self.composer.get_data_retrieval_plan_execution_feedback(state))
 
         if state["data_retrieval_plan_observation"]:
-            system_prompt = runtime.context.prompts_set[
-                sys._getframe(0).f_code.co_name + "_from_data_retrieval_plan_observation"
-            ]
+            prompt_key = "__data_retrieval_plan_from_data_retrieval_plan_observation"
 
-            context_prompt += self.composer.get_dataframe_schema_info()
-            context_prompt += self.composer.get_data_retrieval_plan_observation_feedback(state)
+            context_parts.append(await self.composer.aget_dataframe_schema_info())
+            context_parts.append(self.composer.get_data_retrieval_plan_observation_feedback(state))
 
-        system_message: SystemMessage = SystemMessage(system_prompt + context_prompt)
+        system_message: SystemMessage = SystemMessage(runtime.context.prompts_set[prompt_key] + "".join(context_parts))
 
         llm, llm_input = self.composer.get_runnable_with_input(
             system_message=system_message,
@@ -385,7 +393,7 @@ class Graph:
             schema=DataRetrievalPlan,
         )
 
-        llm_output = llm.invoke(llm_input)
+        llm_output = await llm.ainvoke(llm_input)
         serialized_output: DataRetrievalPlan = DataRetrievalPlan.model_validate(llm_output)
 
         return Command(
@@ -448,7 +456,7 @@ class Graph:
             },
         )
 
-    def __data_retrieval_plan_observation(
+    async def __data_retrieval_plan_observation(
         self, state: State, runtime: Runtime[Context]
     ) -> Command[
         Literal[
@@ -459,10 +467,18 @@ class Graph:
         """
         Node to handle data retrieval plan observation.
         """
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
-        context_prompt: str = self.composer.get_database_schema_info()
-        context_prompt += self.composer.get_data_retrieval_plan(state)
-        context_prompt += self.composer.get_dataframe_schema_info()
+        system_prompt: str = runtime.context.prompts_set["__data_retrieval_plan_observation"]
+        database_schema_info, dataframe_schema_info = await asyncio.gather(
+            self.composer.aget_database_schema_info(),
+            self.composer.aget_dataframe_schema_info(),
+        )
+        context_prompt: str = "".join(
+            (
+                database_schema_info,
+                self.composer.get_data_retrieval_plan(state),
+                dataframe_schema_info,
+            )
+        )
         system_message: SystemMessage = SystemMessage(system_prompt + context_prompt)
 
         llm, llm_input = self.composer.get_runnable_with_input(
@@ -471,7 +487,7 @@ class Graph:
             schema=DataRetrievalPlanObservation,
         )
 
-        llm_output = llm.invoke(llm_input)
+        llm_output = await llm.ainvoke(llm_input)
         serialized_output: DataRetrievalPlanObservation = DataRetrievalPlanObservation.model_validate(llm_output)
 
         if serialized_output.result_is_sufficient:
@@ -498,33 +514,35 @@ class Graph:
             },
         )
 
-    def __analytical_plan(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
+    async def __analytical_plan(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
         """
         Node to handle analytical plan.
         """
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
-        context_prompt: str = self.composer.get_database_schema_info()
-        context_prompt += self.composer.get_data_retrieval_plan(state)
-        context_prompt += self.composer.get_dataframe_schema_info()
+        prompt_key: str = "__analytical_plan"
+        database_schema_info, dataframe_schema_info = await asyncio.gather(
+            self.composer.aget_database_schema_info(),
+            self.composer.aget_dataframe_schema_info(),
+        )
+        context_parts: list[str] = [
+            database_schema_info,
+            self.composer.get_data_retrieval_plan(state),
+            dataframe_schema_info,
+        ]
 
         if state["analytical_plan"]:
-            context_prompt += self.composer.get_analytical_plan(state, original=True)
+            context_parts.append(self.composer.get_analytical_plan(state, original=True))
 
         if state["analytical_plan_execution"]:
-            system_prompt = runtime.context.prompts_set[
-                sys._getframe(0).f_code.co_name + "_from_analytical_plan_execution"
-            ]
+            prompt_key = "__analytical_plan_from_analytical_plan_execution"
 
-            context_prompt += self.composer.get_analytical_plan_execution_feedback(state)
+            context_parts.append(self.composer.get_analytical_plan_execution_feedback(state))
 
         if state["analytical_plan_observation"]:
-            system_prompt = runtime.context.prompts_set[
-                sys._getframe(0).f_code.co_name + "_from_analytical_plan_observation"
-            ]
+            prompt_key = "__analytical_plan_from_analytical_plan_observation"
 
-            context_prompt += self.composer.get_analytical_plan_observation_feedback(state)
+            context_parts.append(self.composer.get_analytical_plan_observation_feedback(state))
 
-        system_message: SystemMessage = SystemMessage(system_prompt + context_prompt)
+        system_message: SystemMessage = SystemMessage(runtime.context.prompts_set[prompt_key] + "".join(context_parts))
 
         llm, llm_input = self.composer.get_runnable_with_input(
             system_message=system_message,
@@ -534,7 +552,7 @@ class Graph:
             structured_output_method="function_calling",
         )
 
-        llm_output = llm.invoke(llm_input)
+        llm_output = await llm.ainvoke(llm_input)
         serialized_output: AnalyticalPlan = AnalyticalPlan.model_validate(llm_output)
 
         for analytical_step in serialized_output.plan:
@@ -552,6 +570,7 @@ class Graph:
         self,
         state: State,
         runtime: Runtime[Context],
+        config: RunnableConfig,
     ) -> Command[
         Literal[
             "analytical_plan",
@@ -561,10 +580,16 @@ class Graph:
         """
         Node to handle analytical plan execution.
         """
-        sandbox: Sandbox = self.composer.prepare_sandbox_environment()
+        thread_id: str = config["configurable"]["thread_id"]
+        sandbox: Sandbox
+        code_context: SandboxCodeContext
+        sandbox, code_context = self.composer.prepare_sandbox_environment(thread_id)
         code: str = self.composer.get_analytical_python_code(state, runtime)
-        execution: Execution = sandbox.run_code(code)
-        sandbox.kill()
+
+        try:
+            execution: Execution = sandbox.run_code(code, context=code_context)
+        finally:
+            sandbox.remove_code_context(code_context)
 
         if execution.error:
             return Command(
@@ -585,7 +610,7 @@ class Graph:
             },
         )
 
-    def __analytical_plan_observation(
+    async def __analytical_plan_observation(
         self,
         state: State,
         runtime: Runtime[Context],
@@ -598,12 +623,20 @@ class Graph:
         """
         Node to handle analytical plan observation.
         """
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
-        context_prompt: str = self.composer.get_database_schema_info()
-        context_prompt += self.composer.get_data_retrieval_plan(state)
-        context_prompt += self.composer.get_dataframe_schema_info()
-        context_prompt += self.composer.get_analytical_plan(state)
-        context_prompt += self.composer.get_analytical_plan_execution_result(state)
+        system_prompt: str = runtime.context.prompts_set["__analytical_plan_observation"]
+        database_schema_info, dataframe_schema_info = await asyncio.gather(
+            self.composer.aget_database_schema_info(),
+            self.composer.aget_dataframe_schema_info(),
+        )
+        context_prompt: str = "".join(
+            (
+                database_schema_info,
+                self.composer.get_data_retrieval_plan(state),
+                dataframe_schema_info,
+                self.composer.get_analytical_plan(state),
+                self.composer.get_analytical_plan_execution_result(state),
+            )
+        )
         system_message: SystemMessage = SystemMessage(system_prompt + context_prompt)
 
         llm, llm_input = self.composer.get_runnable_with_input(
@@ -612,7 +645,7 @@ class Graph:
             schema=AnalyticalPlanObservation,
         )
 
-        llm_output = llm.invoke(llm_input)
+        llm_output = await llm.ainvoke(llm_input)
         serialized_output: AnalyticalPlanObservation = AnalyticalPlanObservation.model_validate(llm_output)
 
         if serialized_output.result_is_sufficient:
@@ -635,14 +668,18 @@ class Graph:
             },
         )
 
-    def __analytical_response(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
+    async def __analytical_response(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
         """
         Node to synthesize validated analytical execution into an interpretable response.
         """
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
-        context_prompt: str = self.composer.get_analytical_plan(state)
-        context_prompt += self.composer.get_analytical_plan_execution_result(state)
-        context_prompt += self.composer.get_analytical_plan_observation_result(state)
+        system_prompt: str = runtime.context.prompts_set["__analytical_response"]
+        context_prompt: str = "".join(
+            (
+                self.composer.get_analytical_plan(state),
+                self.composer.get_analytical_plan_execution_result(state),
+                self.composer.get_analytical_plan_observation_result(state),
+            )
+        )
         system_message: SystemMessage = SystemMessage(system_prompt + context_prompt)
 
         llm, llm_input = self.composer.get_runnable_with_input(
@@ -650,7 +687,7 @@ class Graph:
             state=state,
         )
 
-        llm_output: AIMessage = cast(AIMessage, llm.invoke(llm_input))
+        llm_output: AIMessage = cast(AIMessage, await llm.ainvoke(llm_input))
 
         return {
             "ui_payload": "Ready to go!",
@@ -658,11 +695,11 @@ class Graph:
             "messages": [llm_output],
         }
 
-    def __summarization(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
+    async def __summarization(self, state: State, runtime: Runtime[Context]) -> dict[str, Any]:
         """
         Node to handle summarization.
         """
-        system_prompt: str = runtime.context.prompts_set[sys._getframe(0).f_code.co_name]
+        system_prompt: str = runtime.context.prompts_set["__summarization"]
         system_message: SystemMessage = SystemMessage(system_prompt)
 
         llm, llm_input = self.composer.get_runnable_with_input(
@@ -670,9 +707,10 @@ class Graph:
             state=state,
         )
 
-        llm_output: AIMessage = cast(AIMessage, llm.invoke(llm_input))
+        llm_output: AIMessage = cast(AIMessage, await llm.ainvoke(llm_input))
 
-        self.composer.save_current_interaction(
+        await asyncio.to_thread(
+            self.composer.save_current_interaction,
             state=state,
             llm_output=llm_output,
             turn_num=runtime.context.turn_num,
@@ -688,7 +726,12 @@ class Graph:
     ) -> CompiledStateGraph[State, Context]:
         """
         Construct and compile the analytical execution graph.
+
+        The graph is compiled once; later calls return the same compiled graph.
         """
+        if self.compiled_graph is not None:
+            return self.compiled_graph
+
         self.graph_builder.add_node(
             node="intent_comprehension",
             action=self.__intent_comprehension,
@@ -792,4 +835,6 @@ class Graph:
         self.graph_builder.add_edge(start_key="analytical_response", end_key="summarization")
         self.graph_builder.add_edge(start_key="summarization", end_key=END)
 
-        return self.graph_builder.compile(checkpointer=MemorySaver())
+        self.compiled_graph = self.graph_builder.compile(checkpointer=MemorySaver())
+
+        return self.compiled_graph
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Literal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Context:
     """
     Runtime context for the analytical execution process.
@@ -0,0 +1,145 @@
+# pyright: reportMissingTypeStubs=false
+# pyright: reportUnknownMemberType=false
+
+# standard
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+# third-party
+import sqlglot
+from sqlglot import (
+    exp,
+    ParseError,
+)
+from sqlglot.expressions import Expression
+
+_SQL_VALIDATION_DIALECT: str = "postgres"
+
+# Cheap rejection of statements that lead with a write/DDL keyword (after comments and whitespace).
+# The AST checks stay authoritative for anything nested deeper, e.g. data-modifying CTEs.
+# Block comments use the unrolled /* ... */ form and the repetition is possessive, so a long run of
+# leading comments followed by anything else fails in linear time instead of backtracking.
+_NON_READ_SQL_PREFIX: re.Pattern[str] = re.compile(
+    r"(?:\s+|--[^\n]*|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/)*+"
+    r"(DELETE|UPDATE|INSERT|DROP|TRUNCATE|ALTER|CREATE|MERGE|GRANT|REVOKE)\b",
+    re.IGNORECASE,
+)
+
+_NON_READ_SQL_EXPRESSIONS: tuple[type[Expression], ...] = (
+    exp.Delete,
+    exp.Update,
+    exp.Insert,
+    exp.Create,
+    exp.Alter,
+    exp.Drop,
+    exp.TruncateTable,
+    exp.Merge,
+    exp.Copy,
+    exp.Command,
+    exp.Analyze,
+    exp.Grant,
+    exp.Revoke,
+    exp.Set,
+    exp.Transaction,
+    exp.Commit,
+    exp.Rollback,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaView:
+    """
+    Immutable set of table and column names a query may reference.
+    """
+
+    tables: frozenset[str]
+    columns: frozenset[str]
+
+    @classmethod
+    def from_raw(cls, schema: dict[str, list[dict[str, Any]]]) -> "SchemaView":
+        """
+        Flatten the inspected external database schema into a SchemaView.
+        """
+        return cls(
+            tables=frozenset(schema.keys()),
+            columns=frozenset(col["name"] for col_list in schema.values() for col in col_list),
+        )
+
+
+def _unwrap_query_root(expression: Expression) -> Expression:
+    current: Expression = expression
+
+    while isinstance(current, (exp.Subquery, exp.Paren)):
+        current = current.this
+
+    return current
+
+
+def _read_only_root_violation(tree: Expression) -> str | None:
+    root: Expression = _unwrap_query_root(tree)
+
+    if isinstance(root, (exp.Select, exp.Union)):
+        return None
+
+    return f"only read-only SELECT queries are allowed (got {type(root).__name__})"
+
+
+def _tree_violation(tree: Expression, schema: SchemaView) -> str | None:
+    # Single walk over the tree; a non read-only node takes precedence over the other violations.
+    select_into: str | None = None
+    unknown_table: str | None = None
+    unknown_column: str | None = None
+
+    for node in tree.walk():
+        if isinstance(node, _NON_READ_SQL_EXPRESSIONS):
+            return f"forbidden non read-only SQL ({type(node).__name__})"
+
+        if isinstance(node, exp.Select):
+            if select_into is None and node.args.get("into"):
+                select_into = "SELECT ... INTO is not allowed (creates a database object)"
+        elif isinstance(node, exp.Table):
+            if unknown_table is None and node.name not in schema.tables:
+                unknown_table = f"Unknown table: {node.name}"
+        elif isinstance(node, exp.Column):
+            if unknown_column is None and node.name not in schema.columns:
+                unknown_column = f"Unknown column: {node.name}"
+
+    return select_into or unknown_table or unknown_column
+
+
+@lru_cache(maxsize=512)
+def _parse_sql_query(sql_query: str) -> tuple[Expression, ...]:
+    # The cached trees are shared between calls, so callers must only read them (walk/find), never transform.
+    parsed: list[Expression | None] = sqlglot.parse(sql_query, dialect=_SQL_VALIDATION_DIALECT)
+
+    return tuple(statement for statement in parsed if statement is not None)
+
+
+@lru_cache(maxsize=256)
+def find_sql_query_violation(sql_query: str, schema: SchemaView) -> str | None:
+    """
+    Return why the SQL query may not be executed against the external database, or None when it is a valid
+    read-only query over known tables and columns. Results are memoized per query and schema view.
+    """
+    if match := _NON_READ_SQL_PREFIX.match(sql_query):
+        return f"only read-only SELECT queries are allowed (got {match.group(1).upper()})"
+
+    try:
+        statements: tuple[Expression, ...] = _parse_sql_query(sql_query)
+
+        if len(statements) != 1:
+            return "Exactly one SQL statement is required (multiple statements are not allowed)"
+
+        tree: Expression = statements[0]
+
+        if msg := _read_only_root_violation(tree):
+            return msg
+        if msg := _tree_violation(tree, schema):
+            return msg
+
+    except ParseError as e:
+        return f"Invalid SQL Syntax: {e}"
+
+    return None
@@ -2,8 +2,9 @@
 # pyright: reportUnknownMemberType=false
 
 # standard
+import asyncio
 import uuid
-from collections.abc import Iterator
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any, Literal
 
@@ -36,7 +37,8 @@ from memory.models.chat_history import ChatHistory
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    app.state.graph = Graph().build_graph()
+    app.state.agent = Graph()
+    app.state.graph = app.state.agent.build_graph()
     app.state.prompts_set = prompt_dict
     app.state.analytical_sandbox_bootstrap = load_analytical_sandbox_bootstrap()
     app.state.memory_manager = MemoryManager(internal_db_url)
@@ -45,6 +47,17 @@ async def lifespan(app: FastAPI):
     yield
 
 
+# Presentation filter: only these nodes' free-text answers reach the client as tokens. Structured-output
+# runnables are kept out of the token stream at the source (see Composer.get_runnable_with_input).
+_TOKEN_STREAMING_NODES: frozenset[str] = frozenset(
+    {
+        "punt_response",
+        "direct_response",
+        "data_unavailability_response",
+        "analytical_response",
+    }
+)
+
 app = FastAPI(
     title="Conversational Business Analytics - Agentic AI API",
     version="0.1.0",
@@ -67,7 +80,7 @@ def _stream_graph(
         "recursion_limit": 100,
     }
 
-    def _persist_transition(
+    async def _persist_transition(
         sequence_num: int,
         node_name: str,
         event_type: Literal["update", "interrupt", "complete", "error"],
@@ -90,7 +103,7 @@ def _stream_graph(
             error_message=error_message,
         )
 
-        app.state.memory_manager.store_state_transition(create_state_transition_params())
+        await asyncio.to_thread(app.state.memory_manager.store_state_transition, create_state_transition_params())
 
     def _normalize_interrupt_payload(value: Any) -> dict[str, Any]:
         if isinstance(value, dict):
@@ -98,17 +111,35 @@ def _stream_graph(
 
         return {"message": value}
 
-    def event_generator() -> Iterator[str]:
+    async def event_generator() -> AsyncIterator[str]:
         sequence_num: int = 0
         interrupt_emitted: bool = False
 
         try:
-            for event in graph.stream(
+            async for stream_mode, event in graph.astream(
                 input=graph_input,
                 context=graph_context,  # type: ignore[arg-type]
-                stream_mode="updates",
+                stream_mode=["updates", "messages"],
                 config=config,
             ):
+                if stream_mode == "messages":
+                    message_chunk, metadata = event
+                    token_node: str | None = metadata.get("langgraph_node")
+                    token_content: Any = message_chunk.content
+
+                    if token_node in _TOKEN_STREAMING_NODES and isinstance(token_content, str) and token_content:
+                        payload = json.dumps(
+                            {
+                                "type": "token",
+                                "node": token_node,
+                                "data": token_content,
+                            }
+                        )
+
+                        yield f"data: {payload}\n\n"
+
+                    continue
+
                 sequence_num += 1
                 encoded_event: dict[str, Any] = jsonable_encoder(event)
 
@@ -125,7 +156,7 @@ def _stream_graph(
                         )
                         interrupt_payload: dict[str, Any] = _normalize_interrupt_payload(interrupt_value)
 
-                        _persist_transition(
+                        await _persist_transition(
                             sequence_num=sequence_num,
                             node_name="data_availability",
                             event_type="interrupt",
@@ -144,7 +175,7 @@ def _stream_graph(
 
                     continue
 
-                _persist_transition(
+                await _persist_transition(
                     sequence_num=sequence_num,
                     node_name=node_name,
                     event_type="update",
@@ -160,7 +191,7 @@ def _stream_graph(
 
                 yield f"data: {payload}\n\n"
 
-            graph_state: StateSnapshot = graph.get_state(config)
+            graph_state: StateSnapshot = await graph.aget_state(config)
 
             if graph_state.next:
                 if not interrupt_emitted:
@@ -170,7 +201,7 @@ def _stream_graph(
                             encoded_interrupt: Any = jsonable_encoder(interrupt.value)
                             interrupt_payload = _normalize_interrupt_payload(encoded_interrupt)
 
-                            _persist_transition(
+                            await _persist_transition(
                                 sequence_num=sequence_num,
                                 node_name=task.name or "<interrupt>",
                                 event_type="interrupt",
@@ -189,7 +220,7 @@ def _stream_graph(
             else:
                 sequence_num += 1
 
-                _persist_transition(
+                await _persist_transition(
                     sequence_num=sequence_num,
                     node_name="<complete>",
                     event_type="complete",
@@ -201,7 +232,7 @@ def _stream_graph(
         except Exception as e:
             sequence_num += 1
 
-            _persist_transition(
+            await _persist_transition(
                 sequence_num=sequence_num,
                 node_name="<error>",
                 event_type="error",
@@ -219,6 +250,11 @@ def _stream_graph(
 
             yield f"data: {payload}\n\n"
 
+        finally:
+            # Every run releases the sandbox of its thread, whether it completed, paused on an
+            # interrupt, failed or was dropped by the client; a resumed run acquires a new one.
+            await asyncio.to_thread(app.state.agent.composer.release_sandbox_environment, thread_id)
+
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
 
@@ -228,8 +264,7 @@ def run_agent(request: AgentRequest) -> StreamingResponse:
     Endpoint to run the agent and stream responses.
     """
     graph_input: State = make_initial_state(user_input=request.input)
-    chat_history: list[ChatHistory] = app.state.memory_manager.index_chat_history()
-    turn_num: int = max(chat.turn_num for chat in chat_history) if chat_history else 0
+    turn_num: int = app.state.memory_manager.show_latest_turn_num()
 
     graph_context: Context = Context(
         turn_num=turn_num + 1,
@@ -1,11 +1,12 @@
 # pyright: reportUnknownMemberType=false
 
 # standard
+import threading
+import time
 from collections.abc import Sequence
 from typing import Any
 
 # third-party
-import pandas as pd
 from sqlalchemy import (
     Engine,
     DATE,
@@ -25,6 +26,8 @@ from sqlalchemy.exc import ProgrammingError
 # internal
 from context.datasets import dataset_file_path
 
+EXTERNAL_DATABASE_SCHEMA_TTL_SECONDS: float = 300.0
+
 
 class ContextManager:
     def __init__(self, external_db_url: str) -> None:
@@ -32,10 +35,61 @@ class ContextManager:
         Initialize ContextManager.
         """
         self.external: Engine = create_engine(external_db_url)
+        self._schema_version: int = 0
+        self._external_database_schema: dict[str, list[dict[str, Any]]] | None = None
+        self._external_database_schema_inspected_at: float = 0.0
+        # Guards the cached schema: the schema prefetch thread and to_thread workers of concurrent
+        # requests check and fill it, and only one of them may introspect a cold cache.
+        self._external_database_schema_lock: threading.RLock = threading.RLock()
+
+    @property
+    def schema_version(self) -> int:
+        """
+        Version of the cached external database schema, bumped on refresh or once the cache outlives its TTL.
+        """
+        self._expire_external_database_schema()
+
+        return self._schema_version
+
+    def refresh_external_database_schema(self) -> None:
+        """
+        Drop the cached external database schema so the next inspection hits the database again.
+        """
+        with self._external_database_schema_lock:
+            self._external_database_schema = None
+            self._schema_version += 1
+
+    def _expire_external_database_schema(self) -> None:
+        """
+        Refresh the cached external database schema once it is older than EXTERNAL_DATABASE_SCHEMA_TTL_SECONDS.
+        """
+        with self._external_database_schema_lock:
+            if (
+                self._external_database_schema is not None
+                and time.monotonic() - self._external_database_schema_inspected_at
+                >= EXTERNAL_DATABASE_SCHEMA_TTL_SECONDS
+            ):
+                self.refresh_external_database_schema()
 
     def inspect_external_database(self) -> dict[str, list[dict[str, Any]]]:
         """
         Inspect external database and return table names and column details.
+
+        The result is cached until refresh_external_database_schema is called or
+        EXTERNAL_DATABASE_SCHEMA_TTL_SECONDS elapse.
+        """
+        with self._external_database_schema_lock:
+            self._expire_external_database_schema()
+
+            if self._external_database_schema is None:
+                self._external_database_schema = self._inspect_external_database()
+                self._external_database_schema_inspected_at = time.monotonic()
+
+            return self._external_database_schema
+
+    def _inspect_external_database(self) -> dict[str, list[dict[str, Any]]]:
+        """
+        Run the actual introspection and sampling queries against the external database.
         """
         inspector: Any = inspect(self.external)
         table_names: list[str] = inspector.get_table_names()
@@ -119,6 +173,9 @@ class ContextManager:
         """
         Extract data from external database based on the provided SQL statement and save it to a CSV file.
         """
+        # Deferred to keep importing the context package cheap.
+        import pandas as pd
+
         try:
             with self.external.begin() as connection:
                 df: pd.DataFrame = pd.read_sql(text(statement), connection)
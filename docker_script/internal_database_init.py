@@ -22,6 +22,14 @@ def main() -> None:
         checkfirst=True,
     )
 
+    # create_all skips tables that already exist, so indexes added later must be created explicitly.
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(
+                bind=engine,
+                checkfirst=True,
+            )
+
 
 if __name__ == "__main__":
     main()
@@ -1,3 +1,11 @@
+# standard
+import os
+
+# third-party
+from dotenv import load_dotenv
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
+
 # internal
 from .groq import (
     groq_gpt_120b_low,
@@ -6,7 +14,17 @@ from .groq import (
     groq_qwen,
 )
 
+load_dotenv()
+
+LLM_CACHE_MAXSIZE: int = 1024
+
+if os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true":
+    set_llm_cache(InMemoryCache(maxsize=LLM_CACHE_MAXSIZE))
+
+LOW_EFFORT_FEEDBACK_ENABLED: bool = os.getenv("LOW_EFFORT_FEEDBACK_ENABLED", "false").lower() == "true"
+
 __all__ = [
+    "LOW_EFFORT_FEEDBACK_ENABLED",
     "groq_gpt_120b_low",
     "groq_gpt_120b_medium",
     "groq_gpt_120b_high",
@@ -1,17 +1,19 @@
 # third-party
+from collections.abc import Iterator
 from typing import Any
 from sqlalchemy import (
     CursorResult,
     Engine,
     Row,
     create_engine,
+    func,
     select,
 )
 
 # internal
 from memory.models import (
     ChatHistory,
-    ChatHistoryShow,
+    ChatHistoryShowBatch,
     ShortMemory,
     ShortMemoryShow,
     StateTransition,
@@ -43,6 +45,15 @@ class MemoryManager:
 
             return [ChatHistory.model_validate(row) for row in result.mappings()]
 
+    def show_latest_turn_num(self) -> int:
+        """
+        Show the highest stored chat history turn number, or 0 when there is no chat history yet.
+        """
+        with self.internal.begin() as connection:
+            latest_turn_num: int | None = connection.execute(select(func.max(chat_histories.c.turn_num))).scalar()
+
+            return latest_turn_num or 0
+
     def store_chat_history(self, params: ChatHistory) -> None:
         """
         Store a chat history record.
@@ -50,32 +61,48 @@ class MemoryManager:
         with self.internal.begin() as connection:
             connection.execute(chat_histories.insert().values(**params.model_dump()))
 
-    def show_chat_history(self, params: ChatHistoryShow) -> list[ChatHistory]:
+    def show_chat_history_batch(self, params: ChatHistoryShowBatch) -> list[ChatHistory]:
         """
-        Show chat history for a specific turn number.
+        Show chat history for several turn numbers in a single query.
+
+        Turns come back in the order they were requested, which keeps the relevance order picked
+        during intent comprehension; messages within a turn keep their creation order.
         """
+        if not params.turn_nums:
+            return []
+
+        turn_positions: dict[int, int] = {}
+
+        for position, turn_num in enumerate(params.turn_nums):
+            turn_positions.setdefault(turn_num, position)
+
         with self.internal.begin() as connection:
             result: CursorResult[Row[Any]] = connection.execute(
                 select(chat_histories)
-                .where(chat_histories.c.turn_num == params.turn_num)
+                .where(chat_histories.c.turn_num.in_(params.turn_nums))
                 .order_by(chat_histories.c.created_at)
             )
 
-            return [ChatHistory.model_validate(row) for row in result.mappings()]
+            chat_history: list[ChatHistory] = [ChatHistory.model_validate(row) for row in result.mappings()]
 
-    def index_short_memory(self) -> list[ShortMemory]:
+        return sorted(chat_history, key=lambda chat: turn_positions[chat.turn_num])
+
+    def iter_short_memory_summaries(self) -> Iterator[tuple[int, str]]:
         """
-        Get all short memory records.
+        Stream (turn number, summary) pairs of all short memory records without building model instances.
         """
         with self.internal.begin() as connection:
-            result: CursorResult[Row[Any]] = connection.execute(
-                select(short_memories).order_by(
+            result: CursorResult[Row[Any]] = connection.execution_options(yield_per=100).execute(
+                select(
+                    short_memories.c.turn_num,
+                    short_memories.c.summary,
+                ).order_by(
                     short_memories.c.turn_num,
                     short_memories.c.created_at,
                 )
             )
 
-            return [ShortMemory.model_validate(row) for row in result.mappings()]
+            yield from result
 
     def store_short_memory(self, params: ShortMemory) -> None:
         """
@@ -2,7 +2,7 @@
 from .chat_history import (
     ChatHistory,
     ChatHistoryCreate,
-    ChatHistoryShow,
+    ChatHistoryShowBatch,
 )
 from .short_memory import (
     ShortMemory,
@@ -24,7 +24,7 @@ from .tables import (
 __all__ = [
     "ChatHistory",
     "ChatHistoryCreate",
-    "ChatHistoryShow",
+    "ChatHistoryShowBatch",
     "ShortMemory",
     "ShortMemoryCreate",
     "ShortMemoryShow",
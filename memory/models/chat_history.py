@@ -33,9 +33,9 @@ class ChatHistoryCreate(BaseModel):
         )
 
 
-class ChatHistoryShow(BaseModel):
+class ChatHistoryShowBatch(BaseModel):
     """
-    Schema for showing chat history.
+    Schema for showing chat history of several turns at once.
     """
 
-    turn_num: int
+    turn_nums: list[int]
@@ -5,6 +5,7 @@ from datetime import datetime
 from sqlalchemy import (
     Column,
     DateTime,
+    Index,
     Integer,
     MetaData,
     String,
@@ -25,6 +26,7 @@ chat_histories = Table(
         nullable=False,
         default=datetime.now,
     ),
+    Index("ix_chat_histories_turn_num_created_at", "turn_num", "created_at"),
 )
 
 short_memories = Table(
@@ -38,6 +40,7 @@ short_memories = Table(
         nullable=False,
         default=datetime.now,
     ),
+    Index("ix_short_memories_turn_num_created_at", "turn_num", "created_at"),
 )
 
 state_transitions = Table(
@@ -0,0 +1,27 @@
+# standard
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# internal
+from memory import MemoryManager
+from memory.models import ChatHistory, ChatHistoryShowBatch, metadata
+
+
+def test_chat_history_batch_keeps_the_requested_turn_order(tmp_path: Path) -> None:
+    memory_manager: MemoryManager = MemoryManager(f"sqlite:///{tmp_path / 'memory.db'}")
+    metadata.create_all(memory_manager.internal)
+    started_at: datetime = datetime(2025, 1, 1)
+
+    for offset, (turn_num, role) in enumerate([(1, "human"), (1, "ai"), (2, "human"), (3, "human"), (3, "ai")]):
+        memory_manager.store_chat_history(
+            ChatHistory(
+                turn_num=turn_num,
+                role=role,
+                content=f"turn {turn_num} {role}",
+                created_at=started_at + timedelta(seconds=offset),
+            )
+        )
+
+    chat_history: list[ChatHistory] = memory_manager.show_chat_history_batch(ChatHistoryShowBatch(turn_nums=[3, 1]))
+
+    assert [chat.content for chat in chat_history] == ["turn 3 human", "turn 3 ai", "turn 1 human", "turn 1 ai"]
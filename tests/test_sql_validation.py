@@ -0,0 +1,59 @@
+# standard
+import time
+
+# third-party
+import pytest
+
+# internal
+from agent.sql_validation import (
+    SchemaView,
+    find_sql_query_violation,
+    _NON_READ_SQL_PREFIX,
+)
+
+SCHEMA: SchemaView = SchemaView(
+    tables=frozenset({"orders"}),
+    columns=frozenset({"id", "amount"}),
+)
+
+
+@pytest.mark.parametrize(
+    "sql_query",
+    [
+        "DELETE FROM orders",
+        "  -- cleanup\n /* a ** b */\n\tdrop table orders",
+        "/* multi\nline */ UPDATE orders SET amount = 0",
+        "/***/insert into orders values (1, 2)",
+    ],
+)
+def test_leading_write_keyword_is_rejected(sql_query: str) -> None:
+    assert _NON_READ_SQL_PREFIX.match(sql_query)
+
+
+@pytest.mark.parametrize(
+    "sql_query",
+    [
+        "-- comment\nSELECT amount FROM orders",
+        "/* unterminated DROP",
+        "SELECT 1; DROP TABLE orders",
+    ],
+)
+def test_prefix_does_not_match_read_queries(sql_query: str) -> None:
+    assert _NON_READ_SQL_PREFIX.match(sql_query) is None
+
+
+def test_many_leading_comments_do_not_backtrack() -> None:
+    sql_query: str = "/* x */ " * 200 + "SELECT amount FROM orders"
+
+    started_at: float = time.perf_counter()
+    violation: str | None = find_sql_query_violation(sql_query, SCHEMA)
+    elapsed: float = time.perf_counter() - started_at
+
+    assert violation is None
+    assert elapsed < 1.0
+
+
+def test_many_leading_comments_before_write_are_rejected() -> None:
+    sql_query: str = "/* x */ " * 200 + "DROP TABLE orders"
+
+    assert find_sql_query_violation(sql_query, SCHEMA) == "only read-only SELECT queries are allowed (got DROP)"
@@ -0,0 +1,51 @@
+# standard
+from typing import Any
+
+# third-party
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import BaseModel
+
+# internal
+from agent.composer import _build_structured_runnable
+
+
+class _Verdict(BaseModel):
+    approved: bool
+
+
+class _ScriptedChatModel(BaseChatModel):
+    """
+    Chat model that answers with the next scripted response on every live call.
+    """
+
+    # Shared by reference with model_copy(), so calls made through the copy consume the same script.
+    responses: list[str]
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def _generate(self, messages: list[BaseMessage], stop: list[str] | None = None, **kwargs: Any) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.responses.pop(0)))])
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> Any:
+        return self | PydanticOutputParser(pydantic_object=schema)
+
+
+def test_parse_failure_is_retried_against_the_live_model() -> None:
+    model: _ScriptedChatModel = _ScriptedChatModel(responses=["not json", '{"approved": true}'])
+    set_llm_cache(InMemoryCache())
+
+    try:
+        llm = _build_structured_runnable(model, _Verdict, "json_schema")
+        output: Any = llm.invoke([HumanMessage(content="Approve?")])
+    finally:
+        set_llm_cache(None)
+
+    assert output == _Verdict(approved=True)
+    assert model.responses == []